@@ -13,28 +13,55 @@ Usage:
 
 Options:
     --full          Export all raw data (no trimming, larger file)
+    --keep-plain    Also save an uncompressed JSON file
     --no-gzip       Skip gzip compression
     --json-only     Only output JSON (no gzip), same as --no-gzip
 
 Output:
     tonal_workouts_YYYYMMDD_HHMMSS.json.gz  (compressed, recommended)
-    tonal_workouts_YYYYMMDD_HHMMSS.json     (uncompressed)
+    tonal_workouts_YYYYMMDD_HHMMSS.json     (uncompressed, with --keep-plain or --no-gzip)
 
 Requirements:
-    pip install requests
+    pip install "httpx[http2]" tqdm
+    pip install isal        (optional, faster compression)
+    pigz on PATH            (optional, multi-core compression)
+    pip install orjson      (optional, faster JSON encoding/decoding)
 
 DISCLAIMER: This is an unofficial tool, not affiliated with Tonal Systems, Inc.
 Use at your own risk. See LICENSE for details.
 """
 
-import requests
+import asyncio
+import httpx
+from tqdm import tqdm
 import json
-import gzip
-import sys
+import io
 import os
+import shutil
+import subprocess
+import sys
+from contextlib import ExitStack, contextmanager
 from datetime import datetime
 from getpass import getpass
-from typing import List, Dict, Any, Set
+from typing import List, Dict, Any, Set, Iterator, BinaryIO
+
+# ISA-L's SIMD deflate is several times faster than zlib; fall back to the
+# standard library when it isn't installed. Level 3 is ISA-L's maximum.
+try:
+    from isal import igzip as gzip
+    GZIP_COMPRESS_LEVEL = 3
+except ImportError:
+    import gzip
+    GZIP_COMPRESS_LEVEL = 9
+
+# pigz compresses on every core in a separate process; preferred when installed
+PIGZ = shutil.which('pigz')
+
+# orjson encodes/decodes UTF-8 bytes directly, several times faster than stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 __version__ = "3.0.0"
 
@@ -43,8 +70,14 @@ AUTH0_DOMAIN = "tonal.auth0.com"
 CLIENT_ID = "ERCyexW-xoVG_Yy3RDe-eV4xsOnRHP6L"
 API_BASE = "https://api.tonal.com"
 
+# Upper bound on in-flight API requests when fanning out
+MAX_CONCURRENT_REQUESTS = 16
+
+# Write buffer for export files (the JSON encoder emits many tiny chunks)
+WRITE_BUFFER_SIZE = 1 << 20
+
 # Known Tonal workout types (anything else is likely custom)
-KNOWN_WORKOUT_TYPES = ['PROGRAM', 'ON_DEMAND', 'QUICK_FIT', 'LIVE', 'MOVEMENT', 'ASSESSMENT']
+KNOWN_WORKOUT_TYPES = frozenset({'PROGRAM', 'ON_DEMAND', 'QUICK_FIT', 'LIVE', 'MOVEMENT', 'ASSESSMENT'})
 
 
 # ============================================================================
@@ -52,7 +85,7 @@ KNOWN_WORKOUT_TYPES = ['PROGRAM', 'ON_DEMAND', 'QUICK_FIT', 'LIVE', 'MOVEMENT',
 # Remove fields the dashboard doesn't use to reduce file size
 # ============================================================================
 
-SET_FIELDS_TO_REMOVE = [
+SET_FIELDS_TO_REMOVE = frozenset({
     'beginTimeMCB', 'endTimeMCB',
     'romWeightMode', 'romWeight', 'romWeightFrac',
     'isoModeSpeed', 'dualMotorReps', 'suggestedResistanceLevel',
@@ -61,62 +94,92 @@ SET_FIELDS_TO_REMOVE = [
     'inchesUpdated', 'powerUpdated',
     'triggeredFeedback', 'reps',
     'workoutActivityID', 'workoutId', 'userId', 'setId',
-]
+})
 
-WORKOUT_FIELDS_TO_REMOVE = ['deletedAt']
+WORKOUT_FIELDS_TO_REMOVE = frozenset({'deletedAt'})
 
-USER_FIELDS_TO_REMOVE = [
+USER_FIELDS_TO_REMOVE = frozenset({
     'recentMobileDevice', 'auth0Id', 'isGuestAccount', 'isDemoAccount',
     'watchedSafetyVideo', 'social', 'profileAssetID', 'mobileWorkoutsEnabled',
     'accountType', 'sharingCustomWorkoutsDisabled', 'workoutDurationMin',
     'workoutDurationMax', 'updatedPreferencesAt', 'primaryDeviceType',
     'emailVerified', 'workoutsPerWeek',
-]
+})
 
 
-def trim_dict(data: dict, fields_to_remove: list) -> dict:
-    """Remove specified fields from a dictionary."""
-    return {k: v for k, v in data.items() if k not in fields_to_remove}
+def trim_dict(data: dict, fields_to_remove: frozenset) -> dict:
+    """Remove specified fields from a dictionary in place."""
+    for field in fields_to_remove:
+        data.pop(field, None)
+    return data
 
 
-def trim_set(set_data: dict) -> dict:
-    """Remove unused fields from a single set."""
-    return trim_dict(set_data, SET_FIELDS_TO_REMOVE)
-
-
-def trim_workout(workout: dict) -> dict:
-    """Remove unused fields from a workout and its sets."""
-    trimmed = trim_dict(workout, WORKOUT_FIELDS_TO_REMOVE)
+def compile_trimmer(name: str, fields_to_remove: frozenset, doc: str):
+    """
+    Build a function that removes a fixed set of fields from a dict in place.
     
-    if 'workoutSetActivity' in trimmed:
-        trimmed['workoutSetActivity'] = [
-            trim_set(s) for s in trimmed['workoutSetActivity']
-        ]
+    The field names are known at import time, so the pops are generated as
+    straight-line code instead of looping over the field set on every call.
+    """
+    lines = [f"def {name}(data):"]
+    lines += [f"    data.pop({field!r}, None)" for field in sorted(fields_to_remove)]
+    lines.append("    return data")
     
-    return trimmed
+    namespace = {"__name__": __name__}
+    exec("\n".join(lines), namespace)
+    trimmer = namespace[name]
+    trimmer.__doc__ = doc
+    return trimmer
 
 
-def trim_export(data: dict) -> dict:
-    """Trim entire export to remove unused fields."""
-    trimmed = data.copy()
-    
-    if 'user' in trimmed and trimmed['user']:
-        trimmed['user'] = trim_dict(trimmed['user'], USER_FIELDS_TO_REMOVE)
-    
-    if 'profile' in trimmed and trimmed['profile']:
-        trimmed['profile'] = trim_dict(trimmed['profile'], USER_FIELDS_TO_REMOVE)
-    
-    if 'workouts' in trimmed:
-        trimmed['workouts'] = [trim_workout(w) for w in trimmed['workouts']]
-    
-    return trimmed
+# Called once per set, the hottest trim in the export
+trim_set = compile_trimmer(
+    'trim_set', SET_FIELDS_TO_REMOVE, "Remove unused fields from a single set."
+)
+
+
+def trim_set_hook(obj: dict) -> dict:
+    """JSON object_hook that trims sets while a response is being parsed."""
+    if 'setId' in obj:
+        trim_set(obj)
+    return obj
+
+
+def trim_workouts(workouts: List[dict]) -> List[dict]:
+    """Remove unused top-level fields from workouts parsed with trim_set_hook."""
+    # Inlined trim_dict with the field set bound to a local, since this
+    # runs once per downloaded workout
+    fields_to_remove = WORKOUT_FIELDS_TO_REMOVE
+    for workout in workouts:
+        for field in fields_to_remove:
+            workout.pop(field, None)
+    return workouts
 
 
 # ============================================================================
 # AUTHENTICATION & API
 # ============================================================================
 
-def authenticate(email: str, password: str) -> dict:
+def create_client() -> httpx.AsyncClient:
+    """
+    Create the HTTP client shared by every request in a run.
+    
+    Connections are kept alive and pooled, so each host pays for its TLS
+    handshake once rather than once per request. HTTP/2 multiplexes the
+    concurrent requests over a single connection; the pool limits only come
+    into play if a server falls back to HTTP/1.1.
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=MAX_CONCURRENT_REQUESTS,
+            max_keepalive_connections=MAX_CONCURRENT_REQUESTS
+        ),
+        timeout=30
+    )
+
+
+async def authenticate(client: httpx.AsyncClient, email: str, password: str) -> dict:
     """
     Authenticate with Tonal using OAuth2 Resource Owner Password Grant.
     
@@ -126,7 +189,7 @@ def authenticate(email: str, password: str) -> dict:
     print("\n🔐 Authenticating with Tonal...")
     
     try:
-        response = requests.post(
+        response = await client.post(
             f"https://{AUTH0_DOMAIN}/oauth/token",
             json={
                 "grant_type": "password",
@@ -134,10 +197,9 @@ def authenticate(email: str, password: str) -> dict:
                 "username": email,
                 "password": password,
                 "scope": "openid profile email offline_access"
-            },
-            timeout=30
+            }
         )
-    except requests.exceptions.RequestException as e:
+    except httpx.RequestError as e:
         raise ConnectionError(f"Failed to connect to Tonal: {e}")
     
     if response.status_code == 401:
@@ -151,10 +213,9 @@ def authenticate(email: str, password: str) -> dict:
     return response.json()
 
 
-def get_user_info(id_token: str) -> dict:
+async def get_user_info(client: httpx.AsyncClient) -> dict:
     """Get basic user info including user ID."""
-    headers = {"Authorization": f"Bearer {id_token}"}
-    response = requests.get(f"{API_BASE}/v6/users/userinfo", headers=headers, timeout=30)
+    response = await client.get(f"{API_BASE}/v6/users/userinfo")
     
     if response.status_code != 200:
         raise Exception(f"Failed to get user info: {response.status_code}")
@@ -162,14 +223,9 @@ def get_user_info(id_token: str) -> dict:
     return response.json()
 
 
-def get_user_profile(id_token: str, user_id: str) -> dict:
+async def get_user_profile(client: httpx.AsyncClient, user_id: str) -> dict:
     """Get user profile with stats like total workouts and volume."""
-    headers = {"Authorization": f"Bearer {id_token}"}
-    response = requests.get(
-        f"{API_BASE}/v6/users/{user_id}/profile", 
-        headers=headers, 
-        timeout=30
-    )
+    response = await client.get(f"{API_BASE}/v6/users/{user_id}/profile")
     
     if response.status_code != 200:
         return {}
@@ -177,26 +233,39 @@ def get_user_profile(id_token: str, user_id: str) -> dict:
     return response.json()
 
 
-def download_workouts(id_token: str, user_id: str) -> List[Dict[Any, Any]]:
+def parse_json(response: httpx.Response) -> Any:
+    """Parse a JSON response body, using orjson's faster decoder when available."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def parse_workouts(response: httpx.Response, trim: bool) -> List[Dict[Any, Any]]:
+    """Parse a page of workouts, dropping unused fields while parsing if requested."""
+    if not trim:
+        return parse_json(response)
+    
+    return trim_workouts(response.json(object_hook=trim_set_hook))
+
+
+async def download_workouts(client: httpx.AsyncClient, user_id: str, trim: bool = False) -> List[Dict[Any, Any]]:
     """
     Download all workout activities using header-based pagination.
     
     Tonal's API uses custom headers (pg-offset, pg-limit, pg-total) for pagination.
+    The first page reports the total; the remaining pages are then fetched
+    concurrently and reassembled in offset order.
+    
+    With trim=True, unused fields are dropped as each page is parsed, so they
+    are never kept in memory.
     """
-    all_workouts = []
-    offset = 0
     limit = 100  # API maximum
     
     base_url = f"{API_BASE}/v6/users/{user_id}/workout-activities"
     
     # First request to get total count
-    headers = {
-        "Authorization": f"Bearer {id_token}",
-        "pg-offset": "0",
-        "pg-limit": str(limit)
-    }
-    
-    response = requests.get(base_url, headers=headers, timeout=30)
+    headers = {"pg-offset": "0", "pg-limit": str(limit)}
+    response = await client.get(base_url, headers=headers)
     
     if response.status_code != 200:
         raise Exception(f"Failed to fetch workouts: {response.status_code}")
@@ -210,60 +279,61 @@ def download_workouts(id_token: str, user_id: str) -> List[Dict[Any, Any]]:
     print(f"\n📊 Found {total} workouts to download")
     print("-" * 40)
     
-    while offset < total:
-        headers = {
-            "Authorization": f"Bearer {id_token}",
-            "pg-offset": str(offset),
-            "pg-limit": str(limit)
-        }
-        
-        response = requests.get(base_url, headers=headers, timeout=30)
+    first_batch = parse_workouts(response, trim)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    
+    # tqdm throttles redraws, so pages finishing in quick succession
+    # don't each pay for a terminal flush
+    progress = tqdm(
+        total=total,
+        initial=len(first_batch),
+        bar_format="   [{bar:20}] {n_fmt}/{total_fmt} ({percentage:.0f}%)"
+    )
+    
+    async def fetch_page(offset: int) -> List[Dict[Any, Any]]:
+        headers = {"pg-offset": str(offset), "pg-limit": str(limit)}
+        async with semaphore:
+            response = await client.get(base_url, headers=headers)
         
         if response.status_code != 200:
-            print(f"⚠️  Error at offset {offset}, continuing...")
-            offset += limit
-            continue
+            progress.write(f"⚠️  Error at offset {offset}, continuing...")
+            return []
         
-        batch = response.json()
+        batch = parse_workouts(response, trim)
+        progress.update(len(batch))
+        return batch
+    
+    with progress:
+        batches = await asyncio.gather(
+            *(fetch_page(offset) for offset in range(limit, total, limit))
+        )
+    
+    all_workouts = first_batch
+    for batch in batches:
         all_workouts.extend(batch)
-        
-        # Progress indicator
-        downloaded = min(offset + limit, total)
-        pct = (downloaded / total) * 100
-        bar_len = 20
-        filled = int(bar_len * downloaded / total)
-        bar = "█" * filled + "░" * (bar_len - filled)
-        print(f"\r   [{bar}] {downloaded}/{total} ({pct:.0f}%)", end="", flush=True)
-        
-        offset += limit
     
-    print()  # Newline after progress bar
     print(f"✅ Downloaded {len(all_workouts)} workouts!")
     
     return all_workouts
 
 
-def get_workout_template(id_token: str, workout_id: str) -> dict:
+async def get_workout_template(client: httpx.AsyncClient, workout_id: str) -> dict:
     """Fetch a single workout template by ID (for custom workouts)."""
-    headers = {"Authorization": f"Bearer {id_token}"}
-    response = requests.get(
-        f"{API_BASE}/v6/workouts/{workout_id}", 
-        headers=headers, 
-        timeout=30
-    )
+    response = await client.get(f"{API_BASE}/v6/workouts/{workout_id}")
     
     if response.status_code != 200:
         return None
     
-    return response.json()
+    return parse_json(response)
 
 
-def fetch_custom_workouts(id_token: str, workouts: List[dict]) -> Dict[str, dict]:
+async def fetch_custom_workouts(client: httpx.AsyncClient, workouts: List[dict]) -> Dict[str, dict]:
     """
     Fetch details for custom workout templates.
     
     Custom workouts are user-created and need to be fetched individually
-    to get their names and structure.
+    to get their names and structure. The templates are independent, so
+    they are requested concurrently.
     """
     custom_ids: Set[str] = set()
     
@@ -281,78 +351,87 @@ def fetch_custom_workouts(id_token: str, workouts: List[dict]) -> Dict[str, dict
     
     print(f"\n🏋️  Fetching {len(custom_ids)} custom workout templates...")
     
+    fetched = 0
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    
+    async def fetch_template(workout_id: str) -> dict:
+        nonlocal fetched
+        async with semaphore:
+            details = await get_workout_template(client, workout_id)
+        
+        fetched += 1
+        if fetched % 10 == 0:
+            print(f"   Fetched {fetched}/{len(custom_ids)}...")
+        return details
+    
+    ordered_ids = list(custom_ids)
+    templates = await asyncio.gather(*(fetch_template(wid) for wid in ordered_ids))
+    
     custom_workouts = {}
-    for i, workout_id in enumerate(custom_ids, 1):
-        details = get_workout_template(id_token, workout_id)
+    for workout_id, details in zip(ordered_ids, templates):
         if details:
             custom_workouts[workout_id] = {
                 "id": details.get("id"),
                 "title": details.get("title"),
                 "userId": details.get("userId"),
             }
-        
-        if i % 10 == 0:
-            print(f"   Fetched {i}/{len(custom_ids)}...")
     
     print(f"   ✅ Fetched {len(custom_workouts)} custom workout details!")
     return custom_workouts
 
 
-def get_strength_score_history(id_token: str, user_id: str) -> List[dict]:
-    """Fetch complete strength score history."""
+async def get_strength_score_history(client: httpx.AsyncClient, user_id: str) -> List[dict]:
+    """
+    Fetch complete strength score history.
+    
+    Results are reported with tqdm.write, since this runs alongside the
+    workout download's progress bar.
+    """
     print("\n💪 Fetching Strength Score history...")
     
-    headers = {"Authorization": f"Bearer {id_token}"}
     today = datetime.now().strftime('%Y-%m-%d')
     
-    response = requests.get(
+    response = await client.get(
         f"{API_BASE}/v6/users/{user_id}/strength-scores/history",
-        headers=headers,
-        params={'limit': 5000, 'endDate': today},
-        timeout=30
+        params={'limit': 5000, 'endDate': today}
     )
     
     if response.status_code != 200:
-        print(f"   ⚠️ Failed to fetch strength score history: {response.status_code}")
+        tqdm.write(f"   ⚠️ Failed to fetch strength score history: {response.status_code}")
         return []
     
     history = response.json()
     
     if history:
-        print(f"   ✅ Got {len(history)} strength score entries")
+        tqdm.write(f"   ✅ Got {len(history)} strength score entries")
         latest = history[0] if history else None
         if latest:
-            print(f"   🏆 Current Score: {latest.get('overall', 'N/A')}")
+            tqdm.write(f"   🏆 Current Score: {latest.get('overall', 'N/A')}")
     else:
-        print("   ⚠️ No strength score history found")
+        tqdm.write("   ⚠️ No strength score history found")
     
     return history
 
 
-def get_current_strength_scores(id_token: str, user_id: str) -> dict:
+async def get_current_strength_scores(client: httpx.AsyncClient, user_id: str) -> dict:
     """
     Fetch current strength scores with granular muscle group breakdown.
     
     Returns both raw API response and parsed format for easier use.
+    Like get_strength_score_history, reports results with tqdm.write.
     """
     print("\n💪 Fetching granular Strength Score breakdown...")
     
-    headers = {"Authorization": f"Bearer {id_token}"}
-    
-    response = requests.get(
-        f"{API_BASE}/v6/users/{user_id}/strength-scores/current",
-        headers=headers,
-        timeout=30
-    )
+    response = await client.get(f"{API_BASE}/v6/users/{user_id}/strength-scores/current")
     
     if response.status_code != 200:
-        print(f"   ⚠️ Failed to fetch current strength scores: {response.status_code}")
+        tqdm.write(f"   ⚠️ Failed to fetch current strength scores: {response.status_code}")
         return {}
     
     data = response.json()
     
     if isinstance(data, list) and len(data) > 0:
-        print(f"   ✅ Got granular strength score data!")
+        tqdm.write(f"   ✅ Got granular strength score data!")
         
         # Parse into more usable format
         parsed = {
@@ -376,14 +455,14 @@ def get_current_strength_scores(id_token: str, user_id: str) -> dict:
                 }
         
         if 'Overall' in parsed['regions']:
-            print(f"   🏆 Overall: {parsed['regions']['Overall']}")
+            tqdm.write(f"   🏆 Overall: {parsed['regions']['Overall']}")
         
         return {
             'raw': data,
             'parsed': parsed
         }
     else:
-        print("   ⚠️ No granular strength score data found")
+        tqdm.write("   ⚠️ No granular strength score data found")
         return {}
 
 
@@ -401,43 +480,130 @@ def format_size(size_bytes: int) -> str:
         return f"{size_bytes / (1024 * 1024):.1f} MB"
 
 
-def save_export(data: dict, base_filename: str, use_gzip: bool = True, trim: bool = True) -> dict:
+class CountingWriter:
+    """Pass-through file wrapper that counts the bytes written to it."""
+    
+    def __init__(self, fileobj):
+        self.fileobj = fileobj
+        self.count = 0
+    
+    def write(self, data) -> int:
+        written = self.fileobj.write(data)
+        self.count += written
+        return written
+    
+    def flush(self) -> None:
+        self.fileobj.flush()
+
+
+@contextmanager
+def open_gzip(gz_file: CountingWriter) -> Iterator[BinaryIO]:
+    """
+    Open a stream that gzips everything written to it into gz_file.
+    
+    With pigz installed, compression runs in parallel with encoding, in a
+    separate process fed through a pipe; otherwise it happens in-process.
+    """
+    if PIGZ is None:
+        with gzip.open(gz_file, 'wb', compresslevel=GZIP_COMPRESS_LEVEL) as gz, \
+                io.BufferedWriter(gz, buffer_size=WRITE_BUFFER_SIZE) as stream:
+            yield stream
+        return
+    
+    # pigz writes to the file descriptor directly, bypassing the counter
+    with subprocess.Popen(
+        [PIGZ, '-9', '-c'],
+        stdin=subprocess.PIPE,
+        stdout=gz_file.fileobj,
+        bufsize=WRITE_BUFFER_SIZE
+    ) as process:
+        yield process.stdin
+    
+    if process.returncode != 0:
+        raise Exception(f"pigz failed with exit code {process.returncode}")
+    
+    gz_file.count += os.fstat(gz_file.fileobj.fileno()).st_size
+
+
+def encode_json(data: Any) -> Iterator[bytes]:
+    """
+    Encode data as compact UTF-8 JSON, yielding it in chunks.
+    
+    The stdlib encoder emits thousands of tiny fragments, so they are joined
+    into blocks of about WRITE_BUFFER_SIZE before being encoded and handed to
+    the output files. Non-ASCII text is written as UTF-8 in both encoders.
+    """
+    if orjson is not None:
+        yield orjson.dumps(data)
+        return
+    
+    encoder = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False)
+    pending = []
+    pending_size = 0
+    for fragment in encoder.iterencode(data):
+        pending.append(fragment)
+        pending_size += len(fragment)
+        if pending_size >= WRITE_BUFFER_SIZE:
+            yield ''.join(pending).encode('utf-8')
+            pending = []
+            pending_size = 0
+    
+    if pending:
+        yield ''.join(pending).encode('utf-8')
+
+
+def save_export(data: dict, base_filename: str, use_gzip: bool = True,
+                keep_plain: bool = False) -> dict:
     """
     Save export data to file(s).
     
+    Only the gzipped file is written by default; the uncompressed JSON is
+    written when keep_plain is set or when compression is disabled.
+    
+    Trimming happens while the data is downloaded (see download_export),
+    so encoding is the only pass made over the data here.
+    
     Returns dict with filenames and sizes.
     """
     results = {}
     
-    # Apply trimming if requested
-    if trim:
-        print("\n✂️  Trimming unused fields to reduce file size...")
-        output_data = trim_export(data)
-    else:
-        output_data = data
+    # Encode compact JSON (no pretty-printing) once and write it to every
+    # output file at the same time
+    json_filename = f"{base_filename}.json"
+    gz_filename = f"{base_filename}.json.gz"
     
-    # Convert to compact JSON (no pretty-printing)
-    json_str = json.dumps(output_data, separators=(',', ':'))
-    json_bytes = json_str.encode('utf-8')
+    json_size = 0
     
-    # Always save uncompressed JSON
-    json_filename = f"{base_filename}.json"
-    with open(json_filename, 'w') as f:
-        f.write(json_str)
+    write_plain = keep_plain or not use_gzip
     
-    json_size = len(json_bytes)
-    results['json'] = {
-        'filename': json_filename,
-        'size': json_size
-    }
+    with ExitStack() as stack:
+        outputs = []
+        
+        # Save uncompressed JSON if requested
+        if write_plain:
+            outputs.append(stack.enter_context(
+                open(json_filename, 'wb', buffering=WRITE_BUFFER_SIZE)
+            ))
+        
+        # Save gzipped version if requested, counting the compressed bytes
+        # on their way to disk
+        if use_gzip:
+            gz_counter = CountingWriter(stack.enter_context(open(gz_filename, 'wb')))
+            outputs.append(stack.enter_context(open_gzip(gz_counter)))
+        
+        for chunk in encode_json(data):
+            json_size += len(chunk)
+            for output in outputs:
+                output.write(chunk)
+    
+    if write_plain:
+        results['json'] = {
+            'filename': json_filename,
+            'size': json_size
+        }
     
-    # Save gzipped version if requested
     if use_gzip:
-        gz_filename = f"{base_filename}.json.gz"
-        with gzip.open(gz_filename, 'wb', compresslevel=9) as f:
-            f.write(json_bytes)
-        
-        gz_size = os.path.getsize(gz_filename)
+        gz_size = gz_counter.count
         compression_ratio = (1 - gz_size / json_size) * 100
         
         results['gzip'] = {
@@ -451,9 +617,20 @@ def save_export(data: dict, base_filename: str, use_gzip: bool = True, trim: boo
 
 def print_summary(workouts: List[dict], custom_workouts: dict, strength_history: List[dict]) -> None:
     """Print summary statistics."""
-    total_volume = sum(w.get('totalVolume', 0) for w in workouts)
-    total_reps = sum(w.get('totalReps', 0) for w in workouts)
-    dates = [w.get('beginTime') for w in workouts if w.get('beginTime')]
+    # Aggregate everything in a single pass over the workouts
+    total_volume = 0
+    total_reps = 0
+    first_date = None
+    last_date = None
+    for w in workouts:
+        total_volume += w.get('totalVolume', 0)
+        total_reps += w.get('totalReps', 0)
+        begin_time = w.get('beginTime')
+        if begin_time:
+            if first_date is None or begin_time < first_date:
+                first_date = begin_time
+            if last_date is None or begin_time > last_date:
+                last_date = begin_time
     
     print("\n" + "=" * 50)
     print("📊 YOUR DATA")
@@ -463,8 +640,8 @@ def print_summary(workouts: List[dict], custom_workouts: dict, strength_history:
         print(f"   Custom Workouts: {len(custom_workouts)}")
     print(f"   Total Volume:    {total_volume:,} lbs")
     print(f"   Total Reps:      {total_reps:,}")
-    if dates:
-        print(f"   Date Range:      {min(dates)[:10]} → {max(dates)[:10]}")
+    if first_date:
+        print(f"   Date Range:      {first_date[:10]} → {last_date[:10]}")
     
     if strength_history:
         latest = strength_history[0]
@@ -479,10 +656,63 @@ def print_summary(workouts: List[dict], custom_workouts: dict, strength_history:
 # MAIN
 # ============================================================================
 
+async def download_export(email: str, password: str, trim: bool) -> dict:
+    """
+    Authenticate and download everything that goes into the export.
+    
+    All requests share one client, so connections are reused across calls.
+    With trim=True, unused fields are dropped as each record arrives.
+    Returns the export sections keyed by their names in the output file.
+    """
+    async with create_client() as client:
+        # Authenticate
+        tokens = await authenticate(client, email, password)
+        client.headers["Authorization"] = f"Bearer {tokens['id_token']}"
+        
+        # Get user info
+        user_info = await get_user_info(client)
+        user_id = user_info.get("id")
+        print(f"\n👤 Logged in as: {user_info.get('firstName')} {user_info.get('lastName')}")
+        
+        if trim:
+            trim_dict(user_info, USER_FIELDS_TO_REMOVE)
+        
+        # Everything else only depends on the user ID, so fetch the profile,
+        # strength scores and workouts concurrently
+        profile, strength_history, current_strength, workouts = await asyncio.gather(
+            get_user_profile(client, user_id),
+            get_strength_score_history(client, user_id),
+            get_current_strength_scores(client, user_id),
+            download_workouts(client, user_id, trim=trim)
+        )
+        
+        if trim:
+            trim_dict(profile, USER_FIELDS_TO_REMOVE)
+        
+        if profile.get('totalWorkouts'):
+            print(f"   Total workouts on record: {profile.get('totalWorkouts')}")
+        
+        if not workouts:
+            return {'workouts': workouts}
+        
+        # Fetch custom workout details (needs the downloaded workouts)
+        custom_workouts = await fetch_custom_workouts(client, workouts)
+    
+    return {
+        'user': user_info,
+        'profile': profile,
+        'workouts': workouts,
+        'customWorkouts': custom_workouts,
+        'strengthScoreHistory': strength_history,
+        'currentStrengthScores': current_strength,
+    }
+
+
 def main():
     # Parse command line args
     use_full = '--full' in sys.argv
     skip_gzip = '--no-gzip' in sys.argv or '--json-only' in sys.argv
+    keep_plain = '--keep-plain' in sys.argv
     
     print("=" * 50)
     print(f"🏋️  TONEGET v{__version__}")
@@ -509,48 +739,28 @@ def main():
         sys.exit(1)
     
     try:
-        # Authenticate
-        tokens = authenticate(email, password)
-        id_token = tokens["id_token"]
-        
-        # Get user info
-        user_info = get_user_info(id_token)
-        user_id = user_info.get("id")
-        print(f"\n👤 Logged in as: {user_info.get('firstName')} {user_info.get('lastName')}")
-        
-        # Get profile
-        profile = get_user_profile(id_token, user_id)
-        if profile.get('totalWorkouts'):
-            print(f"   Total workouts on record: {profile.get('totalWorkouts')}")
-        
-        # Download workouts
-        workouts = download_workouts(id_token, user_id)
+        export = asyncio.run(download_export(email, password, trim=not use_full))
+        workouts = export['workouts']
         
         if not workouts:
             print("\n❌ No workouts to export")
             sys.exit(0)
         
-        # Fetch custom workout details
-        custom_workouts = fetch_custom_workouts(id_token, workouts)
-        
-        # Fetch strength scores
-        strength_history = get_strength_score_history(id_token, user_id)
-        current_strength = get_current_strength_scores(id_token, user_id)
+        custom_workouts = export['customWorkouts']
+        strength_history = export['strengthScoreHistory']
         
-        # Sort by date (newest first)
-        workouts.sort(key=lambda x: x.get('beginTime', ''), reverse=True)
+        # Sort by date (newest first). Keys are normalized once up front so a
+        # missing or null beginTime sorts last instead of breaking comparisons.
+        begin_times = [w.get('beginTime') or '' for w in workouts]
+        order = sorted(range(len(workouts)), key=begin_times.__getitem__, reverse=True)
+        workouts[:] = [workouts[i] for i in order]
         
         # Build export
         export_data = {
             'version': '3.0',
             'exportedAt': datetime.now().isoformat() + 'Z',
             'exportedWith': f'ToneGet v{__version__}',
-            'user': user_info,
-            'profile': profile,
-            'workouts': workouts,
-            'customWorkouts': custom_workouts,
-            'strengthScoreHistory': strength_history,
-            'currentStrengthScores': current_strength,
+            **export,
         }
         
         # Save files
@@ -565,7 +775,7 @@ def main():
             export_data, 
             base_filename, 
             use_gzip=not skip_gzip,
-            trim=not use_full
+            keep_plain=keep_plain
         )
         
         # Print summary
@@ -576,9 +786,10 @@ def main():
         print("📁 FILES CREATED")
         print("=" * 50)
         
-        json_info = file_results.get('json', {})
-        print(f"\n   {json_info.get('filename')}")
-        print(f"      Size: {format_size(json_info.get('size', 0))}")
+        if 'json' in file_results:
+            json_info = file_results['json']
+            print(f"\n   {json_info.get('filename')}")
+            print(f"      Size: {format_size(json_info.get('size', 0))}")
         
         if 'gzip' in file_results:
             gz_info = file_results['gzip']